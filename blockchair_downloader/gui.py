@@ -14,58 +14,343 @@ Works on: macOS, Windows, Linux
 """
 
 import os
+import re
 import sys
-import gzip
 import shutil
 import json
-import urllib.request
-import urllib.error
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Set
 import customtkinter as ctk
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tkinter import filedialog, messagebox
 import threading
 import queue
+import subprocess
 import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+try:
+    # ISA-L accelerated inflate (optional, `pip install blockchair-downloader[fast]`)
+    from isal import igzip as gzip
+except ImportError:
+    try:
+        # zlib-ng, same drop-in gzip API (for platforms without isal wheels)
+        from zlib_ng import gzip_ng as gzip
+    except ImportError:
+        import gzip
+
+try:
+    # ISA-L reader that inflates on a background thread while we write
+    from isal.igzip_threaded import open as _gzip_open_threaded
+except ImportError:
+    _gzip_open_threaded = None
+
+try:
+    # Multi-threaded inflate of a single large .gz (optional, `[parallel]` extra)
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+# External pigz (reads, inflates and writes on separate threads); only worth it
+# for large files and when no accelerated in-process gzip is available
+PIGZ = shutil.which("pigz") if gzip.__name__ == "gzip" else None
+
+try:
+    # Faster JSON for the state file (optional, part of the `fast` extra)
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    _json_loads = json.loads
+
+try:
+    # C-backed HTML parser for the directory listings (optional, part of the `fast` extra)
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Network read size (matches CPython's gzip READ_BUFFER_SIZE)
+READ_BUFFER_SIZE = 128 * 1024
+# Decompressed write size for extracted TSVs (fewer, larger write syscalls)
+COPY_BUFFER_SIZE = 1024 * 1024
+# Minimum seconds between per-file progress callbacks
+PROGRESS_INTERVAL = 0.05
+# (connect, read) timeouts for dump requests: fail fast on an unreachable host
+HTTP_TIMEOUT = (10, 60)
+# .gz files up to this size are inflated in one call instead of streamed
+ONESHOT_MAX_SIZE = 32 * 1024 * 1024
+# .gz files from this size on are inflated on all cores when rapidgzip is installed
+PARALLEL_MIN_SIZE = 200 * 1024 * 1024
+
+# HTTP Content-Range: "bytes <start>-<end>/<size>" (206) or "bytes */<size>" (416)
+_CONTENT_RANGE_RE = re.compile(r'bytes (?:(\d+)-\d+|\*)/(\d+|\*)')
+# User-entered dates (same leniency as strptime's %Y-%m-%d)
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+# Trailing file size in a directory listing row: "789", "123K", "1.5M", "2G"
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([KMG]?)\s*$')
+_UNIT_BYTES = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+# Characters not allowed in folder names on Windows (or awkward on macOS)
+_INVALID_PATH_RE = re.compile(r'[<>:"/\\|?*]')
+# Local dump filenames: blockchair_bitcoin_<table>_<YYYY-MM-DD>.tsv[.gz]
+_FNAME_RE = re.compile(r'^blockchair_bitcoin_([a-z]+)_(\d{4}-\d{2}-\d{2})\.tsv(\.gz)?$')
 
 # Set appearance mode and default color theme
 ctk.set_appearance_mode("dark")  # Modes: "System", "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue", "green", "dark-blue"
 
 
+@lru_cache(maxsize=256)
+def parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date (cached, the same few strings are parsed repeatedly)."""
+    match = _DATE_RE.fullmatch(date_str)
+    try:
+        if not match:
+            raise ValueError
+        return datetime(*map(int, match.groups()))
+    except ValueError:
+        raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD") from None
+
+
+@lru_cache(maxsize=64)
+def days_between(start_date: str, end_date: str) -> int:
+    """Number of days in an inclusive YYYY-MM-DD date range."""
+    return (parse_date(end_date) - parse_date(start_date)).days + 1
+
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """Shared CTkFont per (size, weight, family); needs an existing Tk root."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+def format_eta(seconds: float) -> str:
+    """Format a remaining-time estimate as "Xh Ym" or "Ym"."""
+    hours, minutes = divmod(int(seconds / 60), 60)
+    return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+
+
+def _drop_page_cache(path: Path):
+    """Hint the kernel that a file's cached pages won't be read again (POSIX only)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint
+
+
+def _partial_path(path: Path) -> Path:
+    """Temporary name an output file is written under until it is complete."""
+    return path.with_name(path.name + '.partial')
+
+
+class _CountingReader:
+    """
+    File-like wrapper that reports compressed bytes read from a response.
+
+    If tee is given, every compressed byte read is also written to it.
+    """
+
+    def __init__(self, response, total_size: int, progress_callback=None, tee=None):
+        self.response = response
+        self.total_size = total_size
+        self.progress_callback = progress_callback
+        self.tee = tee
+        self.downloaded = 0
+        self._last_report = 0.0
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.response.read(size)
+        if self.tee:
+            self.tee.write(chunk)
+        self._advance(len(chunk))
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        n = self.response.readinto(buffer)
+        if self.tee:
+            self.tee.write(memoryview(buffer)[:n])
+        self._advance(n)
+        return n
+
+    def _advance(self, n: int):
+        self.downloaded += n
+        # EOF reads and the tee drain must not re-report completion
+        if n == 0 or self._done:
+            return
+        if self.progress_callback and self.total_size > 0:
+            now = time.monotonic()
+            self._done = self.downloaded >= self.total_size
+            if now - self._last_report >= PROGRESS_INTERVAL or self._done:
+                self._last_report = now
+                progress = (self.downloaded / self.total_size) * 100
+                self.progress_callback(progress, self.downloaded, self.total_size)
+
+
 class DownloadState:
     """Manages download state persistence."""
 
+    FLUSH_INTERVAL = 2.0  # Seconds between debounced writes
+
     def __init__(self, config_file: Path):
         self.config_file = config_file
         self.state = self.load()
+        self._dirty = False
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
 
     def load(self) -> dict:
         """Load state from file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        try:
+            return _json_loads(self.config_file.read_bytes())
+        except (OSError, ValueError):  # Missing or corrupt state file
+            return {}
 
     def save(self, state: dict):
-        """Save state to file."""
+        """Save state to file (atomically, via a temp file)."""
         self.state = state
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        tmp_file = self.config_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(state))
+            f.flush()
+            os.fsync(f.fileno())  # Data on disk before the rename makes it visible
+        os.replace(tmp_file, self.config_file)
+        self._dirty = False
+        self._last_flush = time.time()
 
     def get(self, key: str, default=None):
         """Get state value."""
         return self.state.get(key, default)
 
     def set(self, key: str, value):
-        """Set state value."""
-        self.state[key] = value
-        self.save(self.state)
+        """Set state value (written to disk at most every FLUSH_INTERVAL)."""
+        self.update({key: value})
+
+    def update(self, values: dict):
+        """Set several state values at once."""
+        self.state.update(values)
+        self._dirty = True
+        if time.time() - self._last_flush > self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Write pending changes to disk."""
+        with self._lock:
+            if self._dirty:
+                self.save(self.state)
+
+
+class KnownOutputs:
+    """Registry of output folders downloads were started in (for resume on startup)."""
+
+    REGISTRY_FILE = Path.home() / ".blockchair_downloader" / "known_outputs.json"
+
+    def __init__(self, registry_file: Optional[Path] = None):
+        self.registry_file = registry_file or self.REGISTRY_FILE
+
+    def load(self) -> List[str]:
+        """Load registered output folders."""
+        try:
+            paths = _json_loads(self.registry_file.read_bytes())
+        except (OSError, ValueError):  # No registry yet or corrupt
+            return []
+        return paths if isinstance(paths, list) else []
+
+    def save(self, paths: List[str]):
+        """Save registered output folders (atomically, via a temp file)."""
+        self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.registry_file.with_suffix('.tmp')
+        tmp_file.write_bytes(_json_dumps(paths))
+        os.replace(tmp_file, self.registry_file)
+
+    def add(self, path: str):
+        """Register an output folder."""
+        paths = self.load()
+        if path not in paths:
+            self.save(paths + [path])
+
+    def remove(self, path: str):
+        """Forget an output folder (download finished)."""
+        paths = self.load()
+        if path in paths:
+            paths.remove(path)
+            self.save(paths)
+
+
+class SizeCache:
+    """
+    Persistent cache of published .gz sizes per table and date (dumps never change).
+
+    Dates a listing didn't contain are remembered for ABSENT_TTL seconds, so
+    ranges reaching past the newest dump don't refetch the listing every time.
+    """
+
+    CACHE_FILE = Path.home() / ".blockchair_downloader" / "sizes.json"
+    ABSENT_TTL = 3600  # New daily dumps may appear after this
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or self.CACHE_FILE
+        try:
+            data = _json_loads(self.cache_file.read_bytes())
+        except (OSError, ValueError):  # No cache yet or corrupt
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        self.sizes = data.get('sizes', {})
+        self.absent = data.get('absent', {})
+
+    def lookup(self, table: str, dates: List[str]) -> Optional[dict]:
+        """Return {date: bytes} if every date is cached or recently absent, else None."""
+        table_sizes = self.sizes.get(table, {})
+        table_absent = self.absent.get(table, {})
+        fresh = time.time() - self.ABSENT_TTL
+        file_sizes = {}
+        for date in dates:
+            if date in table_sizes:
+                file_sizes[date] = table_sizes[date]
+            elif table_absent.get(date, 0) < fresh:
+                return None
+        return file_sizes
+
+    def store(self, table: str, file_sizes: dict, dates: List[str]):
+        """Remember fetched sizes and which dates were missing (call save() to persist)."""
+        self.sizes.setdefault(table, {}).update(file_sizes)
+        now = time.time()
+        # Expired entries are never trusted again, so don't keep them around
+        fresh = now - self.ABSENT_TTL
+        table_absent = {date: seen for date, seen in self.absent.get(table, {}).items()
+                        if seen >= fresh}
+        self.absent[table] = table_absent
+        for date in dates:
+            if date not in file_sizes:
+                table_absent[date] = now
+
+    def save(self):
+        """Save cache to file (atomically, via a temp file)."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        tmp_file.write_bytes(_json_dumps({'sizes': self.sizes, 'absent': self.absent}))
+        os.replace(tmp_file, self.cache_file)
 
 
 class BlockchairDownloader:
@@ -78,6 +363,8 @@ class BlockchairDownloader:
         "outputs": 250,       # MB per day
         "inputs": 200         # MB per day (approximate)
     }
+    MAX_WORKERS = 4  # Concurrent file downloads
+    MISSING_TRUST_DAYS = 30  # 404s for newer days may just not be published yet
 
     def __init__(self, output_dir: str):
         self.output_dir = Path(output_dir)
@@ -86,8 +373,24 @@ class BlockchairDownloader:
         self.state_file = self.output_dir / ".download_state.json"
 
         self.state = DownloadState(self.state_file)
-        self.paused = False
-        self.cancelled = False
+        self.session = requests.Session()  # Keep-alive connections to Blockchair
+        # Bodies are read from response.raw: ask for the .gz bytes exactly as stored
+        self.session.headers['Accept-Encoding'] = 'identity'
+        self.resume_event = threading.Event()  # Cleared while paused
+        self.resume_event.set()
+        self.cancel_event = threading.Event()  # Set by cancel(), seen by all workers
+        self.newly_missing = []  # 404s worth remembering, saved at the end of a run
+        self.missing_cutoff = ""  # Set per run; "" remembers nothing outside a run
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() was called for the current run."""
+        return self.cancel_event.is_set()
+
+    @property
+    def paused(self) -> bool:
+        """Whether downloads are currently paused."""
+        return not self.resume_event.is_set()
 
     def estimate_size(self, start_date: datetime, end_date: datetime,
                      tables: List[str]) -> Tuple[float, float]:
@@ -97,11 +400,8 @@ class BlockchairDownloader:
         Returns:
             (compressed_gb, uncompressed_gb)
         """
-        days = (end - start_date).days + 1
-
-        total_mb_compressed = 0
-        for table in tables:
-            total_mb_compressed += self.TABLES[table] * days
+        days = (end_date - start_date).days + 1
+        total_mb_compressed = sum(self.TABLES[table] for table in tables) * days
 
         compressed_gb = total_mb_compressed / 1024
         uncompressed_gb = compressed_gb / 0.3  # .gz compression ratio ~30%
@@ -110,12 +410,8 @@ class BlockchairDownloader:
 
     def get_date_range(self, start_date: datetime, end_date: datetime) -> List[datetime]:
         """Generate list of dates between start and end."""
-        dates = []
-        current = start_date
-        while current <= end_date:
-            dates.append(current)
-            current += timedelta(days=1)
-        return dates
+        days = (end_date - start_date).days + 1
+        return [start_date + timedelta(days=i) for i in range(days)]
 
     def build_url(self, table: str, date: datetime) -> str:
         """Build download URL for specific table and date."""
@@ -123,95 +419,258 @@ class BlockchairDownloader:
         filename = f"blockchair_bitcoin_{table}_{date_str}.tsv.gz"
         return self.BASE_URL + f"{table}/{filename}"
 
+    def scan_extracted(self, tables: List[str]) -> Set[Tuple[str, str]]:
+        """
+        Return the (table, date_str) pairs already extracted on disk.
+
+        Leftover .partial files from an interrupted extraction are removed
+        on the way, so those days are extracted again.
+        """
+        existing = set()
+        for table in tables:
+            try:
+                with os.scandir(self.extracted_dir / table) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.partial'):
+                            os.unlink(entry.path)
+                            continue
+                        match = _FNAME_RE.match(entry.name)
+                        if match and match.group(1) == table and not match.group(3):
+                            existing.add((table, match.group(2)))
+            except FileNotFoundError:
+                continue
+        return existing
+
     def download_file(self, url: str, output_path: Path,
-                     progress_callback=None) -> bool:
-        """Download single file with progress tracking and pause support."""
+                     progress_callback=None) -> int:
+        """
+        Download single file with progress tracking and pause support.
+
+        A partial file left by an interrupted run is resumed with an HTTP
+        Range request instead of being downloaded again from the start.
+
+        Returns:
+            Bytes fetched in this call (not counting a resumed file's
+            existing bytes), or -1 if not found (404) or cancelled
+        """
+        existing = output_path.stat().st_size if output_path.exists() else 0
+        headers = {'Range': f'bytes={existing}-'} if existing else None
+
         try:
-            # Use urllib instead of requests
-            req = urllib.request.Request(url)
-            response = urllib.request.urlopen(req, timeout=60)
+            with self.session.get(url, stream=True, timeout=HTTP_TIMEOUT,
+                                  headers=headers) as response:
+                if response.status_code == 404:
+                    # Read the short error page so the keep-alive connection
+                    # goes back to the pool instead of being closed
+                    response.content
+                    return -1  # File doesn't exist (normal)
+
+                # Only trust a resume the server confirms for our exact offset
+                content_range = _CONTENT_RANGE_RE.fullmatch(
+                    response.headers.get('Content-Range', ''))
+                if response.status_code == 416:
+                    response.content
+                    # Nothing left to fetch, unless the local file is larger than the remote one
+                    if not content_range or content_range.group(2) == str(existing):
+                        return 0
+                    output_path.unlink()
+                    return self.download_file(url, output_path, progress_callback)
+                if (response.status_code == 206 and existing
+                        and (not content_range or content_range.group(1) != str(existing))):
+                    output_path.unlink()
+                    return self.download_file(url, output_path, progress_callback)
+                response.raise_for_status()
+
+                # Server ignored the Range header: start over
+                if response.status_code != 206:
+                    existing = 0
+
+                total_size = existing + int(response.headers.get('Content-Length', 0))
+                downloaded = existing
+                last_report = 0.0
+
+                # 128 KiB network reads are coalesced into 1 MiB writes
+                with open(output_path, 'ab' if existing else 'wb',
+                          buffering=COPY_BUFFER_SIZE) as f:
+                    while True:
+                        # Check for pause/cancel
+                        if self.cancelled:
+                            return -1
 
-            total_size = int(response.headers.get('Content-Length', 0))
-            downloaded = 0
+                        self.resume_event.wait()  # Blocks while paused; cancel() sets it too
 
-            with open(output_path, 'wb') as f:
-                while True:
-                    # Check for pause/cancel
-                    if self.cancelled:
-                        return False
+                        if self.cancelled:
+                            return -1
 
-                    while self.paused and not self.cancelled:
-                        time.sleep(0.1)
+                        # Read chunk (raw bytes, the .gz is stored as-is)
+                        chunk = response.raw.read(READ_BUFFER_SIZE)
+                        if not chunk:
+                            break
 
-                    if self.cancelled:
-                        return False
+                        f.write(chunk)
+                        downloaded += len(chunk)
 
-                    # Read chunk
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
+                        if progress_callback and total_size > 0:
+                            now = time.monotonic()
+                            if (now - last_report >= PROGRESS_INTERVAL
+                                    or downloaded >= total_size):
+                                last_report = now
+                                progress = (downloaded / total_size) * 100
+                                progress_callback(progress, downloaded, total_size)
 
-                    f.write(chunk)
-                    downloaded += len(chunk)
+            return downloaded - existing
 
-                    if progress_callback and total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        progress_callback(progress, downloaded, total_size)
+        except Exception as e:
+            if self.cancelled:
+                return -1
+            raise Exception(f"Download failed: {e}")
 
-            return True
+    def download_and_extract_streaming(self, url: str, output_path: Path,
+                                       progress_callback=None,
+                                       gz_path: Optional[Path] = None) -> int:
+        """
+        Download a .gz file and decompress it on the fly into output_path.
+
+        The compressed bytes only touch the disk if gz_path is given, in which
+        case they are written there as they stream past (no second read pass).
+        The output is written to a .partial file and renamed into place once
+        complete, so an interrupted run never leaves a truncated .tsv behind;
+        a partial .gz is kept for a Range resume.
+
+        Returns:
+            Compressed bytes downloaded, or -1 if the file does not exist
+            or the download was cancelled.
+        """
+        tmp_path = _partial_path(output_path)
+        try:
+            with self.session.get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+                if response.status_code == 404:
+                    # Read the short error page so the keep-alive connection
+                    # goes back to the pool instead of being closed
+                    response.content
+                    return -1  # File doesn't exist (normal)
+                response.raise_for_status()
+
+                total_size = int(response.headers.get('Content-Length', 0))
+
+                with (open(gz_path, 'wb', buffering=COPY_BUFFER_SIZE)
+                      if gz_path else nullcontext()) as f_gz, \
+                        open(tmp_path, 'wb') as f_out:
+                    reader = _CountingReader(response.raw, total_size,
+                                             progress_callback, tee=f_gz)
+                    with gzip.GzipFile(fileobj=reader, mode='rb') as f_in:
+                        while True:
+                            # Check for pause/cancel
+                            self.resume_event.wait()  # Blocks while paused; cancel() sets it too
+
+                            if self.cancelled:
+                                break
+
+                            chunk = f_in.read(COPY_BUFFER_SIZE)
+                            if not chunk:
+                                break
+                            f_out.write(chunk)
+
+                    # Copy any bytes the decompressor didn't need so the .gz is complete
+                    if f_gz and not self.cancelled:
+                        while reader.read(READ_BUFFER_SIZE):
+                            pass
+                    elif not f_gz and not self.cancelled:
+                        # No .gz to fall back on, so make sure the data is on disk
+                        f_out.flush()
+                        os.fsync(f_out.fileno())
+
+            if self.cancelled:
+                tmp_path.unlink(missing_ok=True)
+                return -1
+            os.replace(tmp_path, output_path)
+            return reader.downloaded
 
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return False  # File doesn't exist (normal)
-            raise
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             if self.cancelled:
-                return False
-            raise Exception(f"Download failed: {str(e)}")
+                return -1
+            raise Exception(f"Download failed: {e}")
 
-    def extract_gz(self, gz_path: Path, output_path: Path) -> bool:
-        """Extract .gz file."""
+    def extract_gz(self, gz_path: Path, output_path: Path,
+                   gz_size: Optional[int] = None) -> bool:
+        """Extract .gz file (gz_size, if known, saves a stat call)."""
+        tmp_path = _partial_path(output_path)
         try:
-            with gzip.open(gz_path, 'rb') as f_in:
-                with open(output_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            if gz_size is None:
+                gz_size = gz_path.stat().st_size
+            if gz_size <= ONESHOT_MAX_SIZE:
+                # Small dump: inflate in a single C call and write it once
+                data = gzip.decompress(gz_path.read_bytes())
+                with open(tmp_path, 'wb') as f_out:
+                    f_out.write(data)
+            elif rapidgzip and gz_size >= PARALLEL_MIN_SIZE:
+                with rapidgzip.open(str(gz_path), parallelization=os.cpu_count()) as f_in:
+                    with open(tmp_path, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out, length=COPY_BUFFER_SIZE)
+            elif PIGZ:
+                with subprocess.Popen([PIGZ, '-dc', str(gz_path)],
+                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+                    with open(tmp_path, 'wb') as f_out:
+                        shutil.copyfileobj(proc.stdout, f_out, length=COPY_BUFFER_SIZE)
+                    _, stderr = proc.communicate()
+                if proc.returncode != 0:
+                    raise Exception(stderr.decode(errors='replace').strip() or "pigz failed")
+            else:
+                with (_gzip_open_threaded or gzip.open)(gz_path, 'rb') as f_in:
+                    with open(tmp_path, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out, length=COPY_BUFFER_SIZE)
+            os.replace(tmp_path, output_path)
             return True
         except Exception as e:
-            raise Exception(f"Extraction failed: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            raise Exception(f"Extraction failed: {e}")
 
     def pause(self):
         """Pause download."""
-        self.paused = True
+        self.resume_event.clear()
+        self.state.flush()
 
     def resume(self):
         """Resume download."""
-        self.paused = False
+        self.resume_event.set()
 
     def cancel(self):
         """Cancel download."""
-        self.cancelled = True
-        self.paused = False
+        self.cancel_event.set()
+        self.resume_event.set()
+        self.state.flush()
 
     def download_and_extract(self, start_date: datetime, end_date: datetime,
                            tables: List[str], remove_gz: bool = True,
                            progress_callback=None, log_callback=None,
-                           file_progress_callback=None) -> dict:
+                           file_progress_callback=None,
+                           max_workers: Optional[int] = None) -> dict:
         """
         Download and extract data for date range.
 
+        Files are processed concurrently by up to ``max_workers`` threads
+        (defaults to ``MAX_WORKERS``); each worker downloads and then
+        extracts its file, so inflate work is spread across cores too.
+        ``progress_callback(completed, total, downloaded_mb)`` is called
+        under the stats lock after each finished file.
+
         Returns:
             dict with statistics
         """
         # Reset state
-        self.paused = False
-        self.cancelled = False
+        self.resume_event.set()
+        self.cancel_event.clear()
 
         # Save download config to state
-        self.state.set('output_dir', str(self.output_dir))
-        self.state.set('start_date', start_date.strftime("%Y-%m-%d"))
-        self.state.set('end_date', end_date.strftime("%Y-%m-%d"))
-        self.state.set('tables', tables)
-        self.state.set('remove_gz', remove_gz)
+        self.state.update({
+            'output_dir': str(self.output_dir),
+            'start_date': start_date.strftime("%Y-%m-%d"),
+            'end_date': end_date.strftime("%Y-%m-%d"),
+            'tables': tables,
+            'remove_gz': remove_gz,
+        })
+        self.state.flush()
 
         # Create directories
         for table in tables:
@@ -220,120 +679,248 @@ class BlockchairDownloader:
 
         dates = self.get_date_range(start_date, end_date)
 
+        # Format each date once (local names use dashes, URLs don't)
+        date_strs = [(date_str, date_str.replace("-", ""))
+                     for date_str in (date.strftime("%Y-%m-%d") for date in dates)]
+        tasks = [(date_str, url_date, table)
+                 for date_str, url_date in date_strs for table in tables]
+
+        # Per-table filename/URL templates, filled in with `% date`
+        templates = {
+            table: (
+                self.raw_dir / table,
+                self.extracted_dir / table,
+                f"blockchair_bitcoin_{table}_%s.tsv",
+                f"{self.BASE_URL}{table}/blockchair_bitcoin_{table}_%s.tsv.gz",
+            )
+            for table in tables
+        }
+
+        # One directory walk instead of an exists() check per file
+        existing = self.scan_extracted(tables)
+
+        # Days that returned 404 on an earlier run aren't requested again
+        known_missing = {(table, date_str)
+                         for table, date_list in self.state.get('missing', {}).items()
+                         for date_str in date_list}
+        self.newly_missing = []
+        self.missing_cutoff = (datetime.now() - timedelta(days=self.MISSING_TRUST_DAYS)
+                               ).strftime("%Y-%m-%d")
+
         stats = {
-            'total': len(dates) * len(tables),
+            'total': len(tasks),
             'successful': 0,
             'skipped': 0,
             'failed': 0,
             'downloaded_mb': 0
         }
 
-        current_task = 0
-        start_time = time.time()
+        stats_lock = threading.Lock()
+        completed = 0
+        # Smoothed seconds between finished downloads, updated once per file
+        self._ewma_secs_per_file = None
+        last_finish = time.time()
+
+        def eta() -> str:
+            """Estimate remaining time from the smoothed per-file rate."""
+            ewma = self._ewma_secs_per_file
+            if ewma is None:
+                return "calculating..."
+            return format_eta(ewma * (stats['total'] - completed))
+
+        def run_task(task_num: int, date_str: str, url_date: str, table: str):
+            nonlocal completed, last_finish
+            if self.cancelled:
+                return
 
-        for date in dates:
-            for table in tables:
+            raw_dir, extracted_dir, tsv_tmpl, url_tmpl = templates[table]
+            tsv_filename = tsv_tmpl % date_str
+            result, size_mb = self._process_one(
+                table, date_str, url_tmpl % url_date,
+                raw_dir / (tsv_filename + ".gz"), extracted_dir / tsv_filename,
+                (table, date_str) in existing, (table, date_str) in known_missing,
+                task_num, stats['total'], remove_gz,
+                eta, log_callback, file_progress_callback
+            )
+            if result is None:  # Cancelled mid-file
+                return
+
+            with stats_lock:
+                stats[result] += 1
+                stats['downloaded_mb'] += size_mb
+                completed += 1
+                if result != 'skipped':
+                    now = time.time()
+                    interval = now - last_finish
+                    last_finish = now
+                    ewma = self._ewma_secs_per_file
+                    self._ewma_secs_per_file = (
+                        interval if ewma is None else 0.9 * ewma + 0.1 * interval
+                    )
+
+                # Update overall progress (under the lock, so counts never go backwards)
+                if progress_callback:
+                    progress_callback(completed, stats['total'], stats['downloaded_mb'])
+
+        # One pooled connection per worker so no thread waits for a socket;
+        # dropped connections and transient server errors are retried with backoff
+        workers = max_workers or self.MAX_WORKERS
+        retries = Retry(total=3, backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers,
+                              max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_task, task_num, *task)
+                       for task_num, task in enumerate(tasks, 1)]
+            for future in as_completed(futures):
+                future.result()
                 if self.cancelled:
-                    if log_callback:
-                        log_callback("\n⏸ Download cancelled by user")
-                    return stats
-
-                current_task += 1
-                date_str = date.strftime("%Y-%m-%d")
-
-                # File paths
-                gz_filename = f"blockchair_bitcoin_{table}_{date_str}.tsv.gz"
-                tsv_filename = f"blockchair_bitcoin_{table}_{date_str}.tsv"
-
-                gz_path = self.raw_dir / table / gz_filename
-                tsv_path = self.extracted_dir / table / tsv_filename
-
-                # Calculate ETA
-                elapsed = time.time() - start_time
-                if current_task > 1:
-                    avg_time_per_file = elapsed / (current_task - 1)
-                    remaining_files = stats['total'] - current_task + 1
-                    eta_seconds = avg_time_per_file * remaining_files
-                    eta_minutes = int(eta_seconds / 60)
-                    eta_hours = eta_minutes // 60
-                    eta_mins = eta_minutes % 60
-                    eta_str = f"{eta_hours}h {eta_mins}m" if eta_hours > 0 else f"{eta_mins}m"
-                else:
-                    eta_str = "calculating..."
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    break
 
-                # Log progress
-                if log_callback:
-                    log_callback(f"[{current_task}/{stats['total']}] {table} {date_str} (ETA: {eta_str})")
+        if self.newly_missing:
+            missing = self.state.get('missing', {})
+            for table, date_str in self.newly_missing:
+                missing.setdefault(table, []).append(date_str)
+            self.state.set('missing', missing)
+        self.state.flush()
+        self.session.close()
 
-                # Skip if already extracted
-                if tsv_path.exists():
-                    if log_callback:
-                        log_callback(f"  → Already exists, skipping")
-                    stats['skipped'] += 1
-                    if progress_callback:
-                        progress_callback(current_task, stats['total'])
-                    continue
+        if self.cancelled and log_callback:
+            log_callback("\n⏸ Download cancelled by user")
 
-                # Download
-                url = self.build_url(table, date)
+        return stats
 
-                try:
+    def _note_missing(self, table: str, date_str: str):
+        """Remember a 404 for a day old enough that the file won't appear later."""
+        if date_str <= self.missing_cutoff:
+            self.newly_missing.append((table, date_str))
+
+    def _process_one(self, table: str, date_str: str, url: str,
+                     gz_path: Path, tsv_path: Path, extracted: bool, known_missing: bool,
+                     task_num: int, total_tasks: int, remove_gz: bool, eta,
+                     log_callback=None, file_progress_callback=None
+                     ) -> Tuple[Optional[str], float]:
+        """
+        Download and extract a single (date, table) file.
+
+        Returns:
+            (stats key to increment or None if cancelled, downloaded MB)
+        """
+        tag = f"[{task_num}/{total_tasks}]"
+
+        # Log progress
+        if log_callback:
+            log_callback(f"{tag} {table} {date_str} (ETA: {eta()})")
+
+        # Skip if already extracted
+        if extracted:
+            if log_callback:
+                log_callback(f"  {tag} → Already exists, skipping")
+            return 'skipped', 0
+
+        if known_missing:
+            if log_callback:
+                log_callback(f"  {tag} → Not found (404) on an earlier run, skipping")
+            return 'skipped', 0
+
+        def download_progress(pct, downloaded, total):
+            if file_progress_callback:
+                file_progress_callback(pct, downloaded, total, task_num, total_tasks)
+
+        try:
+            # A .gz left by an earlier run (kept or interrupted) is resumed and
+            # extracted instead, then removed below if .gz files aren't kept
+            if not gz_path.exists():
+                # Decompress while downloading; a kept .gz is written alongside (tee)
+                if log_callback:
+                    log_callback(f"  {tag} → Downloading & extracting...")
+
+                downloaded = self.download_and_extract_streaming(
+                    url, tsv_path, download_progress,
+                    gz_path=None if remove_gz else gz_path
+                )
+                if downloaded < 0:
+                    if self.cancelled:
+                        return None, 0
+                    self._note_missing(table, date_str)
                     if log_callback:
-                        log_callback(f"  → Downloading...")
+                        log_callback(f"  {tag} → Not found (404), skipping")
+                    return 'skipped', 0
 
-                    def download_progress(pct, downloaded, total):
-                        if file_progress_callback:
-                            file_progress_callback(pct, downloaded, total, current_task, stats['total'])
+                file_size_mb = downloaded / 1024 / 1024
+            else:
+                file_size_mb = 0
+                for attempt in range(2):
+                    if log_callback:
+                        log_callback(f"  {tag} → Downloading...")
 
-                    success = self.download_file(url, gz_path, download_progress)
+                    downloaded = self.download_file(url, gz_path, download_progress)
 
-                    if not success:
+                    if downloaded < 0:
                         if self.cancelled:
-                            return stats
+                            return None, 0
+                        self._note_missing(table, date_str)
                         if log_callback:
-                            log_callback(f"  → Not found (404), skipping")
-                        stats['skipped'] += 1
-                        if progress_callback:
-                            progress_callback(current_task, stats['total'])
-                        continue
+                            log_callback(f"  {tag} → Not found (404), skipping")
+                        return 'skipped', 0
 
-                    # Track size
-                    file_size_mb = gz_path.stat().st_size / 1024 / 1024
-                    stats['downloaded_mb'] += file_size_mb
+                    file_size_mb += downloaded / 1024 / 1024
 
                     # Extract
                     if log_callback:
-                        log_callback(f"  → Extracting...")
-
-                    self.extract_gz(gz_path, tsv_path)
+                        log_callback(f"  {tag} → Extracting...")
 
-                    # Remove .gz if requested
-                    if remove_gz:
-                        gz_path.unlink()
+                    try:
+                        self.extract_gz(gz_path, tsv_path)
+                        break
+                    except Exception as e:
+                        if attempt or self.cancelled:
+                            raise
+                        # A complete .gz is never fetched again (416), so a corrupt
+                        # one would fail on every run: drop it and fetch it whole
+                        gz_path.unlink(missing_ok=True)
                         if log_callback:
-                            log_callback(f"  → Removed .gz file")
+                            log_callback(f"  {tag} → {e}, downloading the .gz again")
 
-                    stats['successful'] += 1
+                # Remove .gz if requested
+                if remove_gz:
+                    gz_path.unlink()
                     if log_callback:
-                        log_callback(f"  ✓ Complete ({file_size_mb:.1f} MB)")
+                        log_callback(f"  {tag} → Removed .gz file")
 
-                except Exception as e:
-                    if self.cancelled:
-                        return stats
-                    stats['failed'] += 1
-                    if log_callback:
-                        log_callback(f"  ✗ Error: {str(e)}")
+            if not remove_gz:
+                # A kept .gz is only an archive copy, don't let it crowd the page cache
+                _drop_page_cache(gz_path)
 
-                # Update overall progress
-                if progress_callback:
-                    progress_callback(current_task, stats['total'])
+            if log_callback:
+                log_callback(f"  {tag} ✓ Complete ({file_size_mb:.1f} MB)")
+            return 'successful', file_size_mb
 
-        return stats
+        except Exception as e:
+            if self.cancelled:
+                return None, 0
+            if log_callback:
+                log_callback(f"  {tag} ✗ Error: {e}")
+            return 'failed', 0
 
 
 class DownloaderGUI:
     """Modern GUI for Bitcoin data downloader with 3-view wizard system."""
 
+    MAX_LOG_LINES = 5000  # Activity log lines kept in the textbox
+    LOG_TRIM_LINES = 500  # Trimmed at once when the limit is hit
+
+    # Stepper look per state: (border color, text color, font weight)
+    STEP_STYLES = {
+        'completed': (("#66bb6a", "#4caf50"), ("#66bb6a", "#4caf50"), "normal"),  # Green
+        'active': (("#ffb74d", "#ff9800"), ("gray10", "gray90"), "bold"),         # Orange
+        'upcoming': (("gray70", "gray25"), ("gray50", "gray50"), "normal"),       # Gray
+    }
+
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("Bitcoin Blockchain Data Downloader")
@@ -351,23 +938,43 @@ class DownloaderGUI:
         # Variables
         self.output_dir = ctk.StringVar()
         self.remove_gz = ctk.BooleanVar(value=True)
+        self.parallel_downloads = ctk.StringVar(value=str(BlockchairDownloader.MAX_WORKERS))
         self.saved_start_date = ""
         self.saved_end_date = ""
 
         # Download state
         self.is_downloading = False
         self.downloader: Optional[BlockchairDownloader] = None
-        self.download_thread = None
-        self.log_queue = queue.Queue()
+        self.cancel_dialog = None
+
+        # One long-lived worker runs downloads queued by start_download_internal
+        self.download_tasks = queue.SimpleQueue()
+        self.download_thread = threading.Thread(target=self.download_loop, daemon=True)
+        self.download_thread.start()
+        self.log_queue = queue.SimpleQueue()
+        # Latest progress (and the result dialog) from the worker, applied by flush_progress
+        self.pending_overall = None
+        self.pending_file = None
+        self.pending_dialog = None
+        # Incomplete downloads found by the startup probe, offered by flush_progress
+        self.pending_resume = None
+        self.total_downloaded_mb = 0
+        self.download_start_time = None
 
         # View management
         self.current_view = None
         self.current_step = 1
         self.calculated_size_compressed = 0
         self.calculated_size_uncompressed = 0
+        # Bumped whenever results are cleared, so late results can be dropped
+        self.calc_generation = 0
+        self.calc_running = False
+        self.size_cache = SizeCache()
+        # Keep-alive connections for directory listings (gzip-encoded by default)
+        self.listing_session = requests.Session()
 
         self.setup_ui()
-        self.process_log_queue()
+        self.flush_progress()
         self.check_for_incomplete_downloads()
 
     def setup_ui(self):
@@ -384,14 +991,14 @@ class DownloaderGUI:
         title = ctk.CTkLabel(
             header_frame,
             text="🐋 Bitcoin Blockchain Downloader",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=ui_font(size=28, weight="bold")
         )
         title.pack(pady=(0, 5))
 
         subtitle = ctk.CTkLabel(
             header_frame,
             text="Download Blockchair dumps locally • Pause & Resume anytime",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             text_color="gray"
         )
         subtitle.pack()
@@ -410,7 +1017,7 @@ class DownloaderGUI:
 
         self.step1_label = ctk.CTkLabel(
             self.step1_container, text="1. Configure",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             height=35
         )
         self.step1_label.pack(pady=8)
@@ -424,7 +1031,7 @@ class DownloaderGUI:
 
         self.step2_label = ctk.CTkLabel(
             self.step2_container, text="2. Calculate Size",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             text_color=("gray50", "gray50"),  # Muted
             height=35
         )
@@ -439,111 +1046,99 @@ class DownloaderGUI:
 
         self.step3_label = ctk.CTkLabel(
             self.step3_container, text="3. Download",
-            font=ctk.CTkFont(size=13),
+            font=ui_font(size=13),
             text_color=("gray50", "gray50"),  # Muted
             height=35
         )
         self.step3_label.pack(pady=8)
 
+        self.steps = [
+            (self.step1_container, self.step1_label, "Configure"),
+            (self.step2_container, self.step2_label, "Calculate Size"),
+            (self.step3_container, self.step3_label, "Download"),
+        ]
+        self.step_states = [None] * len(self.steps)  # Forces the first update
+
         # Main content frame (will hold different views)
         self.content_frame = ctk.CTkFrame(self.root, corner_radius=10, fg_color="transparent")
         self.content_frame.grid(row=2, column=0, sticky="nsew", padx=30, pady=(0, 20))
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
 
+        # Build all views once, navigation only swaps which one is visible
+        self.build_config_view()
+        self.build_calculate_view()
+        self.build_download_view()
+
         # Show first view
         self.show_config_view()
 
-    def clear_content(self):
-        """Clear current content view."""
-        for widget in self.content_frame.winfo_children():
+    def show_view(self, view, step: int):
+        """Make view the visible content view."""
+        if self.current_view is not None:
+            self.current_view.grid_remove()
+        self.current_view = view
+        view.grid()
+        self.update_stepper(step)
+
+    def show_config_view(self):
+        """Show View 1: Configuration."""
+        self.show_view(self.config_view, 1)
+
+    def show_calculate_view(self):
+        """Show View 2: Size Calculation."""
+        # Results are recalculated for the current configuration
+        self.calc_generation += 1
+        for widget in self.size_result_frame.winfo_children():
             widget.destroy()
+        self.start_download_btn.configure(state="disabled")
+        self.calculate_btn.configure(state="disabled" if self.calc_running else "normal")
+        self.show_view(self.calculate_view, 2)
+
+        # Auto-populate summary
+        self.update_config_summary()
+
+    def show_download_view(self):
+        """Show View 3: Download Progress."""
+        self.progress_var.set(0)
+        self.progress_label.configure(text="Ready to start download...")
+        self.file_progress_var.set(0)
+        self.file_progress_label.configure(text="Waiting...")
+        self.speed_label.configure(text="0.0 MB/s")
+        self.pause_button.configure(text="⏸ Pause")
+        self.show_view(self.download_view, 3)
 
     def update_stepper(self, step: int):
         """Update stepper UI to highlight current step."""
         self.current_step = step
 
-        # Colors
-        completed_border = ("#66bb6a", "#4caf50")  # Green
-        active_border = ("#ffb74d", "#ff9800")      # Orange
-        upcoming_border = ("gray70", "gray25")      # Gray
-
-        # Step 1
-        if step > 1:  # Completed
-            self.step1_container.configure(border_color=completed_border)
-            self.step1_label.configure(
-                text="✓ Configure",
-                font=ctk.CTkFont(size=13),
-                text_color=("#66bb6a", "#4caf50")
-            )
-        elif step == 1:  # Active
-            self.step1_container.configure(border_color=active_border)
-            self.step1_label.configure(
-                text="1. Configure",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=("gray10", "gray90")
-            )
-        else:  # Upcoming
-            self.step1_container.configure(border_color=upcoming_border)
-            self.step1_label.configure(
-                text="1. Configure",
-                font=ctk.CTkFont(size=13),
-                text_color=("gray50", "gray50")
-            )
-
-        # Step 2
-        if step > 2:  # Completed
-            self.step2_container.configure(border_color=completed_border)
-            self.step2_label.configure(
-                text="✓ Calculate Size",
-                font=ctk.CTkFont(size=13),
-                text_color=("#66bb6a", "#4caf50")
-            )
-        elif step == 2:  # Active
-            self.step2_container.configure(border_color=active_border)
-            self.step2_label.configure(
-                text="2. Calculate Size",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=("gray10", "gray90")
-            )
-        else:  # Upcoming
-            self.step2_container.configure(border_color=upcoming_border)
-            self.step2_label.configure(
-                text="2. Calculate Size",
-                font=ctk.CTkFont(size=13),
-                text_color=("gray50", "gray50")
-            )
-
-        # Step 3
-        if step > 3:  # Completed
-            self.step3_container.configure(border_color=completed_border)
-            self.step3_label.configure(
-                text="✓ Download",
-                font=ctk.CTkFont(size=13),
-                text_color=("#66bb6a", "#4caf50")
-            )
-        elif step == 3:  # Active
-            self.step3_container.configure(border_color=active_border)
-            self.step3_label.configure(
-                text="3. Download",
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=("gray10", "gray90")
-            )
-        else:  # Upcoming
-            self.step3_container.configure(border_color=upcoming_border)
-            self.step3_label.configure(
-                text="3. Download",
-                font=ctk.CTkFont(size=13),
-                text_color=("gray50", "gray50")
+        for i, (container, label, name) in enumerate(self.steps, 1):
+            if step > i:
+                state = 'completed'
+            elif step == i:
+                state = 'active'
+            else:
+                state = 'upcoming'
+
+            # Only reconfigure steps whose state changed (each configure redraws)
+            if self.step_states[i - 1] == state:
+                continue
+            self.step_states[i - 1] = state
+
+            border_color, text_color, weight = self.STEP_STYLES[state]
+            container.configure(border_color=border_color)
+            label.configure(
+                text=f"✓ {name}" if state == 'completed' else f"{i}. {name}",
+                font=ui_font(size=13, weight=weight),
+                text_color=text_color
             )
 
-    def show_config_view(self):
-        """Show View 1: Configuration."""
-        self.clear_content()
-        self.update_stepper(1)
-
+    def build_config_view(self):
+        """Build View 1: Configuration."""
         view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         view.grid(row=0, column=0, sticky="nsew")
+        view.grid_remove()  # Hidden until show_config_view
+        self.config_view = view
         view.grid_columnconfigure(0, weight=1)
         view.grid_rowconfigure(0, weight=1)
 
@@ -554,7 +1149,7 @@ class DownloaderGUI:
         # Output Directory
         ctk.CTkLabel(
             main_col, text="📁 Output Directory",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(20, 10))
 
         dir_container = ctk.CTkFrame(main_col, fg_color="transparent")
@@ -573,7 +1168,7 @@ class DownloaderGUI:
         # Date Range
         ctk.CTkLabel(
             main_col, text="📅 Date Range",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(10, 10))
 
         date_container = ctk.CTkFrame(main_col, fg_color="transparent")
@@ -598,7 +1193,7 @@ class DownloaderGUI:
         # Presets
         ctk.CTkLabel(
             main_col, text="Quick Presets:",
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=ui_font(size=13, weight="bold")
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
         # First row of presets (short periods from 2025)
@@ -642,14 +1237,24 @@ class DownloaderGUI:
         # Options
         ctk.CTkLabel(
             main_col, text="⚙️ Options",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(10, 10))
 
         ctk.CTkCheckBox(
             main_col,
             text="Remove .gz files after extraction (saves ~70% disk space)",
             variable=self.remove_gz
-        ).pack(anchor="w", padx=20, pady=(0, 20))
+        ).pack(anchor="w", padx=20, pady=(0, 10))
+
+        workers_row = ctk.CTkFrame(main_col, fg_color="transparent")
+        workers_row.pack(anchor="w", padx=20, pady=(0, 20))
+
+        ctk.CTkLabel(workers_row, text="Parallel downloads:").pack(side="left", padx=(0, 10))
+
+        ctk.CTkOptionMenu(
+            workers_row, values=[str(n) for n in range(1, 9)],
+            variable=self.parallel_downloads, width=70
+        ).pack(side="left")
 
         # Bottom Navigation
         nav_frame = ctk.CTkFrame(view, fg_color="transparent")
@@ -659,17 +1264,16 @@ class DownloaderGUI:
         ctk.CTkButton(
             nav_frame, text="Next: Calculate Size →",
             command=self.goto_calculate_view,
-            height=45, font=ctk.CTkFont(size=14, weight="bold"),
+            height=45, font=ui_font(size=14, weight="bold"),
             fg_color=("#2CC985", "#2FA572"), hover_color=("#28B872", "#298F65")
         ).grid(row=0, column=1, sticky="e")
 
-    def show_calculate_view(self):
-        """Show View 2: Size Calculation."""
-        self.clear_content()
-        self.update_stepper(2)
-
+    def build_calculate_view(self):
+        """Build View 2: Size Calculation."""
         view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         view.grid(row=0, column=0, sticky="nsew")
+        view.grid_remove()  # Hidden until show_calculate_view
+        self.calculate_view = view
         view.grid_columnconfigure(0, weight=1)
         view.grid_rowconfigure(1, weight=1)
 
@@ -679,7 +1283,7 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             title_frame, text="📊 Download Size Calculation",
-            font=ctk.CTkFont(size=22, weight="bold")
+            font=ui_font(size=22, weight="bold")
         ).pack()
 
         # Main content area
@@ -700,30 +1304,40 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             summary_frame, text="Configuration Summary",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
         # Config details
         self.summary_container = ctk.CTkFrame(summary_frame, fg_color="transparent")
         self.summary_container.pack(fill="x", padx=20, pady=(0, 10))
+        self.summary_rows = None  # Value labels, built on first update_config_summary
 
         # Folder structure preview
         ctk.CTkLabel(
             summary_frame, text="📂 Folder Structure",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=ui_font(size=11, weight="bold"),
             text_color=("gray40", "gray60")
         ).pack(anchor="w", padx=20, pady=(5, 5))
 
         self.folder_preview_container = ctk.CTkFrame(summary_frame, fg_color="transparent")
         self.folder_preview_container.pack(fill="x", padx=20, pady=(0, 10))
 
+        self.folder_preview_label = ctk.CTkLabel(
+            self.folder_preview_container, text="",
+            font=ui_font(family="Monaco", size=9),
+            anchor="w", justify="left",
+            text_color=("gray30", "gray70")
+        )
+        self.folder_preview_label.pack(anchor="w")
+
         # Calculate button at bottom of summary
-        ctk.CTkButton(
+        self.calculate_btn = ctk.CTkButton(
             summary_frame, text="🔄 Calculate Size",
             command=self.calculate_size_new,
-            height=45, font=ctk.CTkFont(size=14, weight="bold"),
+            height=45, font=ui_font(size=14, weight="bold"),
             fg_color=("#1f538d", "#3b8ed0")
-        ).pack(fill="x", padx=20, pady=(5, 15))
+        )
+        self.calculate_btn.pack(fill="x", padx=20, pady=(5, 15))
 
         # Right Column: Size Results
         right_col = ctk.CTkFrame(content, fg_color="transparent")
@@ -734,7 +1348,7 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             results_frame, text="💾 Download Size",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
         # Size Result container
@@ -748,7 +1362,7 @@ class DownloaderGUI:
         ctk.CTkButton(
             nav_frame, text="← Back to Configure",
             command=self.show_config_view,
-            height=40, font=ctk.CTkFont(size=13),
+            height=40, font=ui_font(size=13),
             fg_color=("#505050", "#404040")
         ).pack(side="left")
 
@@ -756,22 +1370,18 @@ class DownloaderGUI:
         self.start_download_btn = ctk.CTkButton(
             nav_frame, text="Next: Start Download →",
             command=self.goto_download_view,
-            height=40, font=ctk.CTkFont(size=13),
+            height=40, font=ui_font(size=13),
             fg_color=("#2CC985", "#2FA572"), hover_color=("#28B872", "#298F65"),
             state="disabled"
         )
         self.start_download_btn.pack(side="right")
 
-        # Auto-populate summary
-        self.update_config_summary()
-
-    def show_download_view(self):
-        """Show View 3: Download Progress."""
-        self.clear_content()
-        self.update_stepper(3)
-
+    def build_download_view(self):
+        """Build View 3: Download Progress."""
         view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         view.grid(row=0, column=0, sticky="nsew")
+        view.grid_remove()  # Hidden until show_download_view
+        self.download_view = view
         view.grid_columnconfigure(0, weight=1)
         view.grid_rowconfigure(1, weight=1)
 
@@ -781,7 +1391,7 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             progress_top, text="📥 Overall Progress",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(15, 10))
 
         self.progress_var = ctk.DoubleVar()
@@ -791,7 +1401,7 @@ class DownloaderGUI:
 
         self.progress_label = ctk.CTkLabel(
             progress_top, text="Ready to start download...",
-            font=ctk.CTkFont(size=13), anchor="w"
+            font=ui_font(size=13), anchor="w"
         )
         self.progress_label.pack(fill="x", padx=20, pady=(0, 15))
 
@@ -808,7 +1418,7 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             stats_panel, text="📊 Statistics",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(20, 15))
 
         # File Progress
@@ -817,7 +1427,7 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             file_prog_container, text="Current File",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=ui_font(size=12, weight="bold")
         ).pack(anchor="w", padx=15, pady=(10, 5))
 
         self.file_progress_var = ctk.DoubleVar()
@@ -829,7 +1439,7 @@ class DownloaderGUI:
 
         self.file_progress_label = ctk.CTkLabel(
             file_prog_container, text="Waiting...",
-            font=ctk.CTkFont(size=11), anchor="w",
+            font=ui_font(size=11), anchor="w",
             width=250  # Fixed width to prevent resizing
         )
         self.file_progress_label.pack(fill="x", padx=15, pady=(0, 10))
@@ -840,12 +1450,12 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             speed_container, text="Download Speed",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=ui_font(size=12, weight="bold")
         ).pack(anchor="w", padx=15, pady=(10, 5))
 
         self.speed_label = ctk.CTkLabel(
             speed_container, text="0.0 MB/s",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=ui_font(size=14, weight="bold"),
             text_color=("#2CC985", "#2FA572")
         )
         self.speed_label.pack(anchor="w", padx=15, pady=(0, 10))
@@ -857,7 +1467,7 @@ class DownloaderGUI:
         self.pause_button = ctk.CTkButton(
             button_container, text="⏸ Pause",
             command=self.pause_download,
-            height=38, font=ctk.CTkFont(size=13),
+            height=38, font=ui_font(size=13),
             fg_color=("#FF9500", "#FF9500"), hover_color=("#E68600", "#E68600")
         )
         self.pause_button.pack(fill="x", pady=(0, 8))
@@ -865,7 +1475,7 @@ class DownloaderGUI:
         self.cancel_button = ctk.CTkButton(
             button_container, text="⏹ Cancel",
             command=self.cancel_download,
-            height=38, font=ctk.CTkFont(size=13),
+            height=38, font=ui_font(size=13),
             fg_color=("#FF3B30", "#FF453A"), hover_color=("#E6352A", "#E63E34")
         )
         self.cancel_button.pack(fill="x")
@@ -876,10 +1486,10 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             log_panel, text="📋 Activity Log",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=ui_font(size=16, weight="bold")
         ).pack(anchor="w", padx=20, pady=(20, 10))
 
-        self.log_text = ctk.CTkTextbox(log_panel, wrap="word", font=ctk.CTkFont(size=11))
+        self.log_text = ctk.CTkTextbox(log_panel, wrap="word", font=ui_font(size=11))
         self.log_text.pack(fill="both", expand=True, padx=15, pady=(0, 15))
 
     # Navigation functions
@@ -890,9 +1500,12 @@ class DownloaderGUI:
             messagebox.showerror("Error", "Please select an output directory")
             return
 
+        start_date = self.start_entry.get()
+        end_date = self.end_entry.get()
+
         try:
-            start = self.parse_date(self.start_entry.get())
-            end = self.parse_date(self.end_entry.get())
+            start = self.parse_date(start_date)
+            end = self.parse_date(end_date)
         except ValueError as e:
             messagebox.showerror("Error", str(e))
             return
@@ -903,9 +1516,9 @@ class DownloaderGUI:
             messagebox.showerror("Error", "Start date must be before end date")
             return
 
-        # Save entry values before destroying the view
-        self.saved_start_date = self.start_entry.get()
-        self.saved_end_date = self.end_entry.get()
+        # Save entry values for the calculate and download steps
+        self.saved_start_date = start_date
+        self.saved_end_date = end_date
 
         # Navigate to calculate view
         self.show_calculate_view()
@@ -921,43 +1534,38 @@ class DownloaderGUI:
         try:
             start = self.parse_date(self.saved_start_date)
             end = self.parse_date(self.saved_end_date)
-            days = (end - start).days + 1
+            days = days_between(self.saved_start_date, self.saved_end_date)
             tables = self.get_selected_tables()
 
-            # Clear old summary
-            for widget in self.summary_container.winfo_children():
-                widget.destroy()
-
-            # Create grid layout for summary
             items = [
                 ("📁", "Directory:", self.output_dir.get() or 'Not set'),
                 ("📅", "Period:", f"{self.saved_start_date} to {self.saved_end_date} ({days} days)"),
                 ("📊", "Tables:", f"{', '.join(tables) if tables else 'None selected'}"),
-                ("⚙️", "Remove .gz:", 'Yes' if self.remove_gz.get() else 'No')
+                ("⚙️", "Remove .gz:", 'Yes' if self.remove_gz.get() else 'No'),
+                ("⚡", "Parallel:", f"{self.parallel_downloads.get()} downloads")
             ]
 
-            for i, (icon, label, value) in enumerate(items):
-                # Icon
-                ctk.CTkLabel(
-                    self.summary_container, text=icon,
-                    font=ctk.CTkFont(size=13)
-                ).grid(row=i, column=0, sticky="w", padx=(5, 5), pady=5)
-
-                # Label
-                ctk.CTkLabel(
-                    self.summary_container, text=label,
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    anchor="w"
-                ).grid(row=i, column=1, sticky="w", padx=3, pady=5)
-
-                # Value
-                ctk.CTkLabel(
-                    self.summary_container, text=value,
-                    font=ctk.CTkFont(size=12),
-                    anchor="w", text_color=("gray30", "gray70")
-                ).grid(row=i, column=2, sticky="w", padx=(3, 5), pady=5)
-
-            self.summary_container.grid_columnconfigure(2, weight=1)
+            # Create grid layout for summary once, later refreshes only update values
+            if self.summary_rows is None:
+                self.summary_rows = []
+                container = self.summary_container
+                icon_kw = dict(font=ui_font(size=13))
+                label_kw = dict(font=ui_font(size=12, weight="bold"), anchor="w")
+                value_kw = dict(font=ui_font(size=12), anchor="w", text_color=("gray30", "gray70"))
+
+                for i, (icon, label, value) in enumerate(items):
+                    ctk.CTkLabel(container, text=icon, **icon_kw).grid(
+                        row=i, column=0, sticky="w", padx=(5, 5), pady=5)
+                    ctk.CTkLabel(container, text=label, **label_kw).grid(
+                        row=i, column=1, sticky="w", padx=3, pady=5)
+                    value_label = ctk.CTkLabel(container, text=value, **value_kw)
+                    value_label.grid(row=i, column=2, sticky="w", padx=(3, 5), pady=5)
+                    self.summary_rows.append(value_label)
+
+                container.grid_columnconfigure(2, weight=1)
+            else:
+                for value_label, (_, _, value) in zip(self.summary_rows, items):
+                    value_label.configure(text=value)
 
             # Update folder structure preview
             self.update_folder_preview(start, end)
@@ -967,20 +1575,16 @@ class DownloaderGUI:
             print(f"Error in update_config_summary: {e}")
             import traceback
             traceback.print_exc()
+            for widget in self.summary_container.winfo_children():
+                widget.destroy()
+            self.summary_rows = None
             ctk.CTkLabel(
                 self.summary_container, text="Invalid configuration",
-                font=ctk.CTkFont(size=13), text_color="red"
+                font=ui_font(size=13), text_color="red"
             ).grid(row=0, column=0, padx=15, pady=15)
 
     def update_folder_preview(self, start, end):
         """Update folder structure preview in calculate view."""
-        # Clear old preview
-        for widget in self.folder_preview_container.winfo_children():
-            widget.destroy()
-
-        # Calculate total files
-        total_days = (end - start).days + 1
-
         # Create subfolder name
         subfolder = f"bitcoin_blockchain_{self.saved_start_date}_to_{self.saved_end_date}"
 
@@ -995,28 +1599,23 @@ class DownloaderGUI:
         ]
 
         # Display the structure
-        structure_text = "\n".join(lines)
-        ctk.CTkLabel(
-            self.folder_preview_container, text=structure_text,
-            font=ctk.CTkFont(family="Monaco", size=9),
-            anchor="w", justify="left",
-            text_color=("gray30", "gray70")
-        ).pack(anchor="w")
+        self.folder_preview_label.configure(text="\n".join(lines))
 
     def fetch_file_sizes_for_table(self, table: str, start, end) -> dict:
         """Fetch actual file sizes for a specific table from Blockchair."""
-        import requests
-        from bs4 import BeautifulSoup
-        import re
-        from datetime import timedelta
+        from bs4 import BeautifulSoup  # Only needed once sizes are calculated
 
         url = f"https://gz.blockchair.com/bitcoin/{table}/"
         file_sizes = {}
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.listing_session.get(url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, _HTML_PARSER)
+
+            # Index the listing by filename once instead of scanning it per date
+            links = {link['href'].rsplit('/', 1)[-1]: link
+                     for link in soup.find_all('a', href=True)}
 
             # Parse directory listing
             current_date = start
@@ -1025,30 +1624,18 @@ class DownloaderGUI:
                 filename = f"blockchair_bitcoin_{table}_{date_str}.tsv.gz"
 
                 # Find the file in the listing
-                for link in soup.find_all('a', href=True):
-                    if filename in link['href']:
-                        # Get the parent row to find the size
-                        parent = link.parent
-                        text = parent.get_text()
-
-                        # Extract size (format: "123K" or "1.5M" or "789" bytes)
-                        size_match = re.search(r'(\d+(?:\.\d+)?)\s*([KMG]?)\s*$', text.strip())
-                        if size_match:
-                            size_value = float(size_match.group(1))
-                            size_unit = size_match.group(2)
-
-                            # Convert to bytes
-                            if size_unit == 'K':
-                                size_bytes = size_value * 1024
-                            elif size_unit == 'M':
-                                size_bytes = size_value * 1024 * 1024
-                            elif size_unit == 'G':
-                                size_bytes = size_value * 1024 * 1024 * 1024
-                            else:
-                                size_bytes = size_value
-
-                            file_sizes[date_str] = size_bytes
-                        break
+                link = links.get(filename)
+                if link is not None:
+                    # Get the parent row to find the size
+                    parent = link.parent
+                    text = parent.get_text()
+
+                    # Extract size (format: "123K" or "1.5M" or "789" bytes)
+                    size_match = _SIZE_RE.search(text.strip())
+                    if size_match:
+                        # Convert to bytes
+                        file_sizes[date_str] = (float(size_match.group(1))
+                                                * _UNIT_BYTES[size_match.group(2)])
 
                 current_date += timedelta(days=1)
 
@@ -1060,15 +1647,25 @@ class DownloaderGUI:
 
     def calculate_size_new(self):
         """Calculate and display actual download size by fetching from Blockchair."""
+        if self.calc_running:
+            return
+
         try:
             start = self.parse_date(self.saved_start_date)
             end = self.parse_date(self.saved_end_date)
+            days = days_between(self.saved_start_date, self.saved_end_date)
             tables = self.get_selected_tables()
 
             if start > end:
                 messagebox.showerror("Error", "Start date must be before end date")
                 return
 
+            # One calculation at a time, re-enabled when results (or an error) arrive
+            self.calc_running = True
+            self.calc_generation += 1
+            generation = self.calc_generation
+            self.calculate_btn.configure(state="disabled")
+
             # Clear old result and show loading
             for widget in self.size_result_frame.winfo_children():
                 widget.destroy()
@@ -1078,7 +1675,7 @@ class DownloaderGUI:
 
             ctk.CTkLabel(
                 loading_container, text="🔍 Fetching file sizes from Blockchair...",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=ui_font(size=16, weight="bold")
             ).pack(pady=(0, 15))
 
             self.calc_progress_var = ctk.DoubleVar()
@@ -1090,31 +1687,67 @@ class DownloaderGUI:
 
             self.calc_status_label = ctk.CTkLabel(
                 loading_container, text="Preparing...",
-                font=ctk.CTkFont(size=13), text_color="gray"
+                font=ui_font(size=13), text_color="gray"
             )
             self.calc_status_label.pack()
 
+            def on_ui(callback):
+                # Skip UI updates once the results were cleared (config changed)
+                self.root.after(0, lambda: callback() if generation == self.calc_generation else None)
+
+            def finish(results=None, error=None):
+                # Runs on the Tk thread
+                self.calc_running = False
+                if generation != self.calc_generation:
+                    self.calculate_btn.configure(state="normal")  # Stale, just allow a new run
+                    return
+                if error is not None:
+                    messagebox.showerror("Error", f"Failed to fetch file sizes: {error}")
+                    self.show_calculate_view()
+                    return
+                compressed_gb, uncompressed_gb, table_sizes = results
+                self.calculated_size_compressed = compressed_gb
+                self.calculated_size_uncompressed = uncompressed_gb
+                self.display_size_results(compressed_gb, uncompressed_gb, table_sizes)
+
             # Run calculation in thread to keep UI responsive
-            import threading
             def calculate_thread():
                 try:
                     table_sizes = {}
                     total_compressed = 0
+                    dates = [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(days)]
+
+                    # Only hit Blockchair for tables with some date in range not cached yet
+                    file_sizes = {table: self.size_cache.lookup(table, dates) for table in tables}
+                    to_fetch = [table for table in tables if file_sizes[table] is None]
 
-                    for i, table in enumerate(tables):
+                    if to_fetch:
                         # Update UI
-                        self.root.after(0, lambda t=table: self.calc_status_label.configure(
-                            text=f"Fetching {t} file sizes..."
+                        on_ui(lambda: self.calc_status_label.configure(
+                            text=f"Fetching {', '.join(to_fetch)} file sizes..."
                         ))
 
-                        file_sizes = self.fetch_file_sizes_for_table(table, start, end)
-                        table_total = sum(file_sizes.values())
+                        # One listing per table, fetched concurrently
+                        with ThreadPoolExecutor(max_workers=len(to_fetch)) as pool:
+                            futures = {
+                                pool.submit(self.fetch_file_sizes_for_table, table, start, end): table
+                                for table in to_fetch
+                            }
+                            for done, future in enumerate(as_completed(futures), 1):
+                                table = futures[future]
+                                file_sizes[table] = future.result()
+                                self.size_cache.store(table, file_sizes[table], dates)
+
+                                # Update progress
+                                progress = done / len(to_fetch)
+                                on_ui(lambda p=progress: self.calc_progress_var.set(p))
+
+                    for table in tables:
+                        table_total = sum(file_sizes[table].values())
                         table_sizes[table] = table_total
                         total_compressed += table_total
 
-                        # Update progress
-                        progress = (i + 1) / len(tables)
-                        self.root.after(0, lambda p=progress: self.calc_progress_var.set(p))
+                    self.size_cache.save()
 
                     # Estimate uncompressed size (TSV is ~2.5x larger than gz)
                     total_uncompressed = total_compressed * 2.5
@@ -1123,22 +1756,18 @@ class DownloaderGUI:
                     compressed_gb = total_compressed / (1024 ** 3)
                     uncompressed_gb = total_uncompressed / (1024 ** 3)
 
-                    self.calculated_size_compressed = compressed_gb
-                    self.calculated_size_uncompressed = uncompressed_gb
-
                     # Display results
-                    self.root.after(0, lambda: self.display_size_results(
-                        compressed_gb, uncompressed_gb, table_sizes
-                    ))
+                    self.root.after(0, lambda: finish((compressed_gb, uncompressed_gb, table_sizes)))
 
                 except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to fetch file sizes: {str(e)}"))
-                    self.root.after(0, self.show_calculate_view)
+                    error = str(e)  # e is unbound once the except block ends
+                    self.root.after(0, lambda: finish(error=error))
 
             thread = threading.Thread(target=calculate_thread, daemon=True)
             thread.start()
 
         except Exception as e:
+            self.calc_running = False
             messagebox.showerror("Error", str(e))
 
     def display_size_results(self, compressed_gb, uncompressed_gb, table_sizes):
@@ -1161,14 +1790,14 @@ class DownloaderGUI:
             # Table name
             ctk.CTkLabel(
                 row, text=f"{table}:",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=ui_font(size=12, weight="bold"),
                 anchor="w", width=120
             ).pack(side="left")
 
             # Compressed size
             ctk.CTkLabel(
                 row, text=f"{size_gb:.2f} GB (compressed)",
-                font=ctk.CTkFont(size=12),
+                font=ui_font(size=12),
                 anchor="w", text_color=("gray30", "gray70")
             ).pack(side="left")
 
@@ -1186,13 +1815,13 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             total_row1, text="📦 Total Compressed:",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             anchor="w", width=180
         ).pack(side="left")
 
         ctk.CTkLabel(
             total_row1, text=f"{compressed_gb:.2f} GB",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             anchor="w"
         ).pack(side="left")
 
@@ -1202,13 +1831,13 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             total_row2, text="📂 Uncompressed (est.):",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             anchor="w", width=180
         ).pack(side="left")
 
         ctk.CTkLabel(
             total_row2, text=f"~{uncompressed_gb:.2f} GB",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=ui_font(size=13, weight="bold"),
             anchor="w"
         ).pack(side="left")
 
@@ -1220,14 +1849,14 @@ class DownloaderGUI:
 
         ctk.CTkLabel(
             total_row3, text="💿 Disk Space Needed:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=ui_font(size=14, weight="bold"),
             anchor="w", width=180,
             text_color=("#2CC985", "#2FA572")
         ).pack(side="left")
 
         ctk.CTkLabel(
             total_row3, text=f"~{disk_space:.2f} GB",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=ui_font(size=14, weight="bold"),
             anchor="w",
             text_color=("#2CC985", "#2FA572")
         ).pack(side="left")
@@ -1236,67 +1865,82 @@ class DownloaderGUI:
         ctk.CTkLabel(
             self.size_result_frame,
             text="Note: Uncompressed size is estimated at ~2.5x the compressed size",
-            font=ctk.CTkFont(size=10),
+            font=ui_font(size=10),
             text_color=("gray50", "gray60"),
             anchor="w"
         ).pack(fill="x", pady=(15, 0))
 
         # Enable start button
         self.start_download_btn.configure(state="normal")
+        self.calculate_btn.configure(state="normal")
 
     def check_for_incomplete_downloads(self):
         """Check for incomplete downloads and offer to resume."""
-        # Will check all common locations for state files
-        common_paths = [
-            Path.home() / "bitcoin_data",
-            Path("/Volumes/MySSD/bitcoin_data"),
-            Path("/Volumes/ExternalSSD/bitcoin_data"),
-            Path("D:/bitcoin_data"),
-            Path("E:/bitcoin_data"),
-        ]
+        # Only folders downloads were actually started in, not a list of guesses
+        candidates = KnownOutputs().load()
 
-        for path in common_paths:
-            state_file = path / ".download_state.json"
-            if state_file.exists():
+        def find_states():
+            states = []
+            for path in candidates:
                 try:
-                    state = DownloadState(state_file)
-
-                    # Check if we should offer to resume
-                    output_dir = state.get('output_dir')
-                    start_date = state.get('start_date')
-                    end_date = state.get('end_date')
-                    tables = state.get('tables')
-                    remove_gz = state.get('remove_gz', True)  # Default True
-
-                    if output_dir and start_date and end_date and tables:
-                        answer = messagebox.askyesno(
-                            "Resume Download?",
-                            f"Found incomplete download:\n\n"
-                            f"Location: {output_dir}\n"
-                            f"Period: {start_date} to {end_date}\n"
-                            f"Tables: {', '.join(tables)}\n"
-                            f"Remove .gz: {remove_gz}\n\n"
-                            f"Resume this download?"
-                        )
-
-                        if answer:
-                            self.output_dir.set(output_dir)
-                            self.start_entry.delete(0, 'end')
-                            self.start_entry.insert(0, start_date)
-                            self.end_entry.delete(0, 'end')
-                            self.end_entry.insert(0, end_date)
-
-                            # Set remove_gz option
-                            self.remove_gz.set(remove_gz)
-
-                            self.log(f"✓ Loaded previous download configuration")
-                            self.log(f"  Period: {start_date} to {end_date}")
-                            self.log(f"  Tables: {', '.join(tables)}")
-                            self.log(f"  Remove .gz: {remove_gz}")
-                            self.log(f"  Files that already exist will be skipped automatically")
-                            return
-                except:
-                    pass
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            if entry.name == ".download_state.json" and entry.is_file():
+                                states.append(DownloadState(Path(entry.path)))
+                                break
+                except OSError:  # Folder deleted or drive not mounted
+                    continue
+            if states:
+                self.pending_resume = states
+
+        # Probe in a daemon thread so a stalled network/USB mount can't freeze startup;
+        # flush_progress shows the prompt from the Tk thread once the probe is done
+        threading.Thread(target=find_states, daemon=True).start()
+
+    def offer_resume(self, states: List[DownloadState]):
+        """Ask whether to resume the first incomplete download found."""
+        if self.is_downloading:  # User already started one while we were probing
+            return
+
+        for state in states:
+            try:
+                # Check if we should offer to resume
+                output_dir = state.get('output_dir')
+                start_date = state.get('start_date')
+                end_date = state.get('end_date')
+                tables = state.get('tables')
+                remove_gz = state.get('remove_gz', True)  # Default True
+
+                if output_dir and start_date and end_date and tables:
+                    answer = messagebox.askyesno(
+                        "Resume Download?",
+                        f"Found incomplete download:\n\n"
+                        f"Location: {output_dir}\n"
+                        f"Period: {start_date} to {end_date}\n"
+                        f"Tables: {', '.join(tables)}\n"
+                        f"Remove .gz: {remove_gz}\n\n"
+                        f"Resume this download?"
+                    )
+
+                    if answer:
+                        # The state records the dated subfolder, the entry holds its parent
+                        self.output_dir.set(str(Path(output_dir).parent))
+                        self.start_entry.delete(0, 'end')
+                        self.start_entry.insert(0, start_date)
+                        self.end_entry.delete(0, 'end')
+                        self.end_entry.insert(0, end_date)
+
+                        # Set remove_gz option
+                        self.remove_gz.set(remove_gz)
+
+                        self.log(f"✓ Loaded previous download configuration")
+                        self.log(f"  Period: {start_date} to {end_date}")
+                        self.log(f"  Tables: {', '.join(tables)}")
+                        self.log(f"  Remove .gz: {remove_gz}")
+                        self.log(f"  Files that already exist will be skipped automatically")
+                        return
+            except:
+                pass
 
     def browse_directory(self):
         """Browse for output directory."""
@@ -1313,7 +1957,6 @@ class DownloaderGUI:
 
     def set_preset_relative(self, days: int):
         """Set date preset relative to today (last N days)."""
-        from datetime import datetime, timedelta
         end = datetime.now()
         start = end - timedelta(days=days - 1)  # -1 because we include today
         self.start_entry.delete(0, 'end')
@@ -1329,36 +1972,114 @@ class DownloaderGUI:
         """Sanitize folder name for cross-platform compatibility."""
         # Replace any characters that might be problematic on Windows or Mac
         # Keep only alphanumeric, dash, underscore
-        import re
         # Remove or replace invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
+        sanitized = _INVALID_PATH_RE.sub('_', name)
         # Remove trailing dots and spaces (Windows doesn't like them)
         sanitized = sanitized.rstrip('. ')
         return sanitized
 
     def parse_date(self, date_str: str) -> datetime:
         """Parse date string."""
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
+        return parse_date(date_str)
 
     def log(self, message: str):
-        """Add message to log."""
+        """Add message to log (safe to call from worker threads, drained by flush_progress)."""
         self.log_queue.put(message)
 
     def process_log_queue(self):
         """Process log messages from queue."""
+        messages = []
         try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.insert("end", message + "\n")
-                self.log_text.see("end")
+            for _ in range(200):
+                messages.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
 
-        # Schedule next check
-        self.root.after(100, self.process_log_queue)
+        if messages:
+            # Only follow new output if the user hasn't scrolled up to read
+            at_bottom = self.log_text.yview()[1] > 0.999
+
+            # One insert and one scroll per batch instead of per line
+            self.log_text.insert("end", "\n".join(messages) + "\n")
+            if at_bottom:
+                self.log_text.see("end")
+
+            # Keep only the newest lines so long runs don't grow the widget forever;
+            # trim a block at a time so the delete doesn't run on every batch
+            lines = int(self.log_text.index("end-1c").split(".")[0])
+            if lines > self.MAX_LOG_LINES:
+                keep = self.MAX_LOG_LINES - self.LOG_TRIM_LINES
+                self.log_text.delete("1.0", f"{lines - keep + 1}.0")
+
+    def flush_progress(self):
+        """
+        Apply the latest worker output to the widgets (~10 times a second while busy).
+
+        Worker threads never call into Tk: they queue log lines and leave
+        progress, the result dialog and the resume offer in pending slots
+        for this poller.
+        """
+        self.process_log_queue()
+
+        overall, self.pending_overall = self.pending_overall, None
+        if overall:
+            self.update_overall_progress(*overall)
+
+        file_progress, self.pending_file = self.pending_file, None
+        if file_progress:
+            self.update_file_progress(*file_progress)
+
+        # Poll slowly while no download is running (and no log backlog is left)
+        busy = self.is_downloading or overall or file_progress or not self.log_queue.empty()
+        self.root.after(100 if busy else 500, self.flush_progress)
+
+        # Modal dialogs last, once the next poll is scheduled
+        states, self.pending_resume = self.pending_resume, None
+        if states:
+            self.offer_resume(states)
+
+        dialog, self.pending_dialog = self.pending_dialog, None
+        if dialog:
+            show, title, message = dialog
+            show(title, message)
+
+    @staticmethod
+    def set_progress(var, label, fraction: float, text: str):
+        """Set a progress bar and its label, skipping values that wouldn't change the display."""
+        # Bar redraws on every variable write; under 0.1% is below a pixel
+        if abs(var.get() - fraction) >= 0.001 or fraction >= 1:
+            var.set(fraction)
+        if label.cget("text") != text:
+            label.configure(text=text)
+
+    def update_overall_progress(self, current: int, total: int):
+        """Show overall progress (files done out of total)."""
+        pct = (current / total) * 100
+        self.set_progress(
+            self.progress_var, self.progress_label, pct / 100,
+            f"Overall: {current}/{total} files ({pct:.1f}%) • {self.total_downloaded_mb:.1f} MB"
+        )
+
+    def update_file_progress(self, pct: float, downloaded: int, total: int,
+                             current_file: int, total_files: int):
+        """Show progress and speed for the file currently downloading."""
+        mb = downloaded / 1024 / 1024
+        total_mb = total / 1024 / 1024
+
+        # Calculate speed
+        if self.download_start_time is None:
+            return
+        elapsed = time.time() - self.download_start_time
+        if elapsed > 0:
+            speed_mbps = self.total_downloaded_mb / elapsed
+            speed_text = f"{speed_mbps:.2f} MB/s"
+            if self.speed_label.cget("text") != speed_text:
+                self.speed_label.configure(text=speed_text)
+
+        self.set_progress(
+            self.file_progress_var, self.file_progress_label, pct / 100,
+            f"{pct:.0f}% • {mb:.1f}/{total_mb:.1f} MB • File {current_file}/{total_files}"
+        )
 
     def start_download_internal(self):
         """Start download in background thread (called from download view)."""
@@ -1378,8 +2099,8 @@ class DownloaderGUI:
 
             # Check if directory already exists and has content
             if output_path.exists():
-                # Check if directory has any files
-                has_files = any(output_path.rglob('*'))
+                # Check if directory has any entries (stops at the first one)
+                has_files = next(output_path.iterdir(), None) is not None
                 if has_files:
                     # Ask user if they want to continue/resume or create new folder
                     answer = messagebox.askyesnocancel(
@@ -1395,7 +2116,6 @@ class DownloaderGUI:
                         return
                     elif answer is False:  # No - create new folder
                         # Add timestamp to make it unique
-                        from datetime import datetime
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         subfolder_name = f"bitcoin_blockchain_{self.saved_start_date}_to_{self.saved_end_date}_{timestamp}"
                         subfolder_name = self.sanitize_folder_name(subfolder_name)
@@ -1403,23 +2123,39 @@ class DownloaderGUI:
                     # If Yes, continue with existing folder (resume)
 
             output_path.mkdir(parents=True, exist_ok=True)
+
+            # Warn before starting rather than when the disk fills up hours in
+            needed_gb = self.calculated_size_uncompressed
+            if not self.remove_gz.get():
+                needed_gb += self.calculated_size_compressed
+            # Files a resumed folder already holds (extracted/, raw/) need no new space
+            have_gb = sum(f.stat().st_size for f in output_path.rglob("*") if f.is_file()) / (1024 ** 3)
+            needed_gb = max(needed_gb - have_gb, 0)
+            free_gb = shutil.disk_usage(output_path).free / (1024 ** 3)
+            if needed_gb > free_gb and not messagebox.askyesno(
+                "Not Enough Disk Space",
+                f"This download needs about {needed_gb:.1f} GB, "
+                f"but only {free_gb:.1f} GB is free on the target drive.\n\n"
+                f"Start anyway?"
+            ):
+                return
+
             self.log(f"Output directory: {output_path}")
 
             # Store output path for download worker
             self.actual_output_path = str(output_path)
 
+            # Remember the folder so an interrupted download is offered on next start
+            KnownOutputs().add(self.actual_output_path)
+
             # Start download thread
             self.is_downloading = True
             self.log_text.delete("1.0", "end")
             self.progress_var.set(0)
             self.file_progress_var.set(0)
 
-            self.download_thread = threading.Thread(
-                target=self.download_worker,
-                args=(start, end, tables),
-                daemon=True
-            )
-            self.download_thread.start()
+            self.download_tasks.put((start, end, tables, self.remove_gz.get(),
+                                     int(self.parallel_downloads.get())))
 
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -1442,106 +2178,142 @@ class DownloaderGUI:
             self.log("⏸ Download paused (you can close and resume later)")
 
     def cancel_download(self):
-        """Cancel download."""
+        """Ask for confirmation (non-modal, progress keeps updating) and cancel download."""
         if not self.downloader:
             return
 
-        answer = messagebox.askyesno(
-            "Cancel Download",
-            "Are you sure you want to cancel?\n\n"
-            "You can resume later - already downloaded files will be kept."
-        )
+        # Already asking
+        if self.cancel_dialog is not None and self.cancel_dialog.winfo_exists():
+            self.cancel_dialog.focus()
+            return
 
-        if answer:
-            self.downloader.cancel()
-            self.log("⏹ Cancelling download...")
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Cancel Download")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        self.cancel_dialog = dialog
 
-    def download_worker(self, start: datetime, end: datetime, tables: List[str]):
-        """Worker thread for downloading."""
-        try:
-            # Use the actual output path (with subfolder)
-            self.downloader = BlockchairDownloader(self.actual_output_path)
+        ctk.CTkLabel(
+            dialog,
+            text="Are you sure you want to cancel?\n\n"
+                 "You can resume later - already downloaded files will be kept.",
+            font=ui_font(size=13), justify="left"
+        ).pack(padx=25, pady=(20, 15))
 
-            # Track total downloaded MB
-            self.total_downloaded_mb = 0
-            self.download_start_time = None
+        def confirm():
+            dialog.destroy()
+            if self.downloader:
+                self.downloader.cancel()
+                self.log("⏹ Cancelling download...")
 
-            def progress_callback(current, total):
-                pct = (current / total) * 100
-                self.root.after(0, lambda: self.progress_var.set(pct / 100))
-                self.root.after(0, lambda c=current, t=total, p=pct:
-                    self.progress_label.configure(
-                        text=f"Overall: {c}/{t} files ({p:.1f}%) • {self.total_downloaded_mb:.1f} MB"
-                    ))
+        button_row = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_row.pack(fill="x", padx=25, pady=(0, 20))
 
-            def file_progress_callback(pct, downloaded, total, current_file, total_files):
-                import time
+        ctk.CTkButton(
+            button_row, text="Keep Downloading",
+            command=dialog.destroy,
+            height=36, font=ui_font(size=13),
+            fg_color=("#505050", "#404040")
+        ).pack(side="left", expand=True, fill="x", padx=(0, 5))
 
-                # Track download speed
-                if self.download_start_time is None:
-                    self.download_start_time = time.time()
+        ctk.CTkButton(
+            button_row, text="⏹ Cancel Download",
+            command=confirm,
+            height=36, font=ui_font(size=13),
+            fg_color=("#FF3B30", "#FF453A"), hover_color=("#E6352A", "#E63E34")
+        ).pack(side="left", expand=True, fill="x", padx=(5, 0))
 
-                mb = downloaded / 1024 / 1024
-                total_mb = total / 1024 / 1024
+    def download_loop(self):
+        """Worker thread: run queued downloads one after another."""
+        while True:
+            self.download_worker(*self.download_tasks.get())
 
-                # Calculate speed
-                elapsed = time.time() - self.download_start_time
-                if elapsed > 0:
-                    speed_mbps = self.total_downloaded_mb / elapsed
-                    self.root.after(0, lambda s=speed_mbps:
-                        self.speed_label.configure(text=f"{s:.2f} MB/s"))
+    def download_worker(self, start: datetime, end: datetime, tables: List[str],
+                        remove_gz: bool, max_workers: int):
+        """
+        Download and extract one date range (runs on the worker thread).
 
-                # Update file progress
-                self.root.after(0, lambda: self.file_progress_var.set(pct / 100))
-                self.root.after(0, lambda p=pct, m=mb, tm=total_mb, cf=current_file, tf=total_files:
-                    self.file_progress_label.configure(
-                        text=f"{p:.0f}% • {m:.1f}/{tm:.1f} MB • File {cf}/{tf}"
-                    ))
+        The result dialog is left in pending_dialog for flush_progress, so
+        the worker never blocks on (or touches) a Tk dialog itself.
+        """
+        try:
+            # Use the actual output path (with subfolder)
+            self.downloader = BlockchairDownloader(self.actual_output_path)
 
-                # Update total downloaded (when file completes)
-                if pct >= 100:
-                    self.total_downloaded_mb += total_mb
+            # Drop progress left over from the previous run
+            self.pending_overall = None
+            self.pending_file = None
+
+            # Track total downloaded MB (for the speed display)
+            self.total_downloaded_mb = 0
+            self.download_start_time = time.time()
+
+            # Callbacks run on worker threads: they only record the latest
+            # values, flush_progress applies them to the widgets
+            def progress_callback(current, total, downloaded_mb):
+                # Called under the downloader's stats lock, one file at a time
+                self.total_downloaded_mb = downloaded_mb
+                self.pending_overall = (current, total)
+
+            file_lock = threading.Lock()
+            latest_file = 0
+
+            def file_progress_callback(pct, downloaded, total, current_file, total_files):
+                nonlocal latest_file
+                # Several files are in flight: follow the most recently started one
+                with file_lock:
+                    if current_file < latest_file:
+                        return
+                    latest_file = current_file
+                    self.pending_file = (pct, downloaded, total, current_file, total_files)
 
             def log_callback(message):
-                self.root.after(0, lambda msg=message: self.log(msg))
-
-            self.log("="*60)
-            self.log("BITCOIN BLOCKCHAIN DATA DOWNLOAD")
-            self.log("="*60)
-            self.log(f"Period: {start.date()} to {end.date()}")
-            self.log(f"Tables: {', '.join(tables)}")
-            self.log(f"Output: {self.actual_output_path}")
-            self.log(f"Remove .gz: {self.remove_gz.get()}")
-            self.log("="*60)
-            self.log("")
-            self.log("⚠️  Downloads are sequential (Blockchair limitation)")
-            self.log("   You can pause/resume anytime using the buttons.")
-            self.log("   Already downloaded files will be skipped automatically.")
-            self.log("")
+                self.log(message)
+
+            # Banners are logged as one message (one queue item, one insert)
+            self.log("\n".join([
+                "="*60,
+                "BITCOIN BLOCKCHAIN DATA DOWNLOAD",
+                "="*60,
+                f"Period: {start.date()} to {end.date()}",
+                f"Tables: {', '.join(tables)}",
+                f"Output: {self.actual_output_path}",
+                f"Remove .gz: {remove_gz}",
+                "="*60,
+                "",
+                f"⚡ Downloading up to {max_workers} files in parallel",
+                "   You can pause/resume anytime using the buttons.",
+                "   Already downloaded files will be skipped automatically.",
+                "",
+            ]))
 
             stats = self.downloader.download_and_extract(
                 start, end, tables,
-                remove_gz=self.remove_gz.get(),
+                remove_gz=remove_gz,
                 progress_callback=progress_callback,
                 log_callback=log_callback,
-                file_progress_callback=file_progress_callback
+                file_progress_callback=file_progress_callback,
+                max_workers=max_workers
             )
 
             if self.downloader.cancelled:
                 # Download was cancelled
-                self.log("")
-                self.log("="*60)
-                self.log("DOWNLOAD CANCELLED")
-                self.log("="*60)
-                self.log(f"✓ Successful: {stats['successful']}")
-                self.log(f"⏭ Skipped: {stats['skipped']}")
-                self.log(f"📦 Downloaded: {stats['downloaded_mb']:.1f} MB")
-                self.log("="*60)
-                self.log("")
-                self.log("You can resume this download later.")
-                self.log("Already downloaded files are saved and won't be re-downloaded.")
-
-                messagebox.showinfo(
+                self.log("\n".join([
+                    "",
+                    "="*60,
+                    "DOWNLOAD CANCELLED",
+                    "="*60,
+                    f"✓ Successful: {stats['successful']}",
+                    f"⏭ Skipped: {stats['skipped']}",
+                    f"📦 Downloaded: {stats['downloaded_mb']:.1f} MB",
+                    "="*60,
+                    "",
+                    "You can resume this download later.",
+                    "Already downloaded files are saved and won't be re-downloaded.",
+                ]))
+
+                self.pending_dialog = (
+                    messagebox.showinfo,
                     "Download Cancelled",
                     f"Download was cancelled.\n\n"
                     f"✓ Downloaded: {stats['successful']} files ({stats['downloaded_mb']:.1f} MB)\n"
@@ -1550,28 +2322,35 @@ class DownloaderGUI:
                     f"Progress has been saved."
                 )
             else:
-                self.log("")
-                self.log("="*60)
-                self.log("DOWNLOAD COMPLETE")
-                self.log("="*60)
-                self.log(f"Total files: {stats['total']}")
-                self.log(f"✓ Successful: {stats['successful']}")
-                self.log(f"⏭ Skipped: {stats['skipped']}")
-                self.log(f"✗ Failed: {stats['failed']}")
-                self.log(f"📦 Downloaded: {stats['downloaded_mb']:.1f} MB")
-                self.log("="*60)
-                self.log("")
-                self.log(f"Data saved to: {self.actual_output_path}")
-                self.log("")
-                self.log("Next steps:")
-                self.log("1. Open Jupyter: ./start_project.sh")
-                self.log("2. Open: notebooks/01_data_exploration.ipynb")
-                self.log("3. Set: config = DataConfig(source='local')")
+                # Failed files still need a resume, so keep those runs listed
+                if stats['failed'] == 0:
+                    KnownOutputs().remove(self.actual_output_path)
+
+                self.log("\n".join([
+                    "",
+                    "="*60,
+                    "DOWNLOAD COMPLETE",
+                    "="*60,
+                    f"Total files: {stats['total']}",
+                    f"✓ Successful: {stats['successful']}",
+                    f"⏭ Skipped: {stats['skipped']}",
+                    f"✗ Failed: {stats['failed']}",
+                    f"📦 Downloaded: {stats['downloaded_mb']:.1f} MB",
+                    "="*60,
+                    "",
+                    f"Data saved to: {self.actual_output_path}",
+                    "",
+                    "Next steps:",
+                    "1. Open Jupyter: ./start_project.sh",
+                    "2. Open: notebooks/01_data_exploration.ipynb",
+                    "3. Set: config = DataConfig(source='local')",
+                ]))
 
                 # Show appropriate message based on results
                 if stats['successful'] == 0 and stats['skipped'] > 0:
                     # All files were skipped (404 errors)
-                    messagebox.showerror(
+                    self.pending_dialog = (
+                        messagebox.showerror,
                         "Download Failed",
                         f"No files were downloaded!\n\n"
                         f"All {stats['skipped']} files returned 404 (Not Found).\n\n"
@@ -1583,7 +2362,8 @@ class DownloaderGUI:
                     )
                 elif stats['failed'] > 0 or stats['skipped'] > 0:
                     # Some files failed or were skipped
-                    messagebox.showwarning(
+                    self.pending_dialog = (
+                        messagebox.showwarning,
                         "Download Completed with Issues",
                         f"Download finished with some problems:\n\n"
                         f"✓ Successful: {stats['successful']}\n"
@@ -1594,7 +2374,8 @@ class DownloaderGUI:
                     )
                 else:
                     # All successful
-                    messagebox.showinfo(
+                    self.pending_dialog = (
+                        messagebox.showinfo,
                         "Download Complete",
                         f"All files downloaded successfully!\n\n"
                         f"✓ {stats['successful']} files\n"
@@ -1603,8 +2384,8 @@ class DownloaderGUI:
                     )
 
         except Exception as e:
-            self.log(f"\n❌ ERROR: {str(e)}")
-            messagebox.showerror("Download Failed", str(e))
+            self.log(f"\n❌ ERROR: {e}")
+            self.pending_dialog = (messagebox.showerror, "Download Failed", str(e))
 
         finally:
             self.is_downloading = False